@@ -8,8 +8,10 @@
 
 import getpass
 import logging
+import os
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -18,6 +20,7 @@ from submitthem import Job
 
 FILE = Path(__file__)
 LOGS = FILE.parent / "logs" / f"{FILE.stem}_log"
+INTERRUPTED = r"!!! Interrupted on: (\S+)"
 
 log = logging.getLogger("preemption_main")
 formatter = logging.Formatter("%(name)s %(levelname)s (%(asctime)s) - %(message)s")
@@ -64,10 +67,13 @@ def pascal_job(partition: str, timeout_min: int, node: str = "") -> Job:
     return ex.submit(clock, partition, timeout_min)
 
 
-def wait_job_is_running(job: Job) -> None:
+def wait_job_is_running(job: Job, max_delay_s: float = 60.0) -> None:
+    # start polling quickly (short transitions), then back off up to max_delay_s
+    delay_s = 2.0
     while job.state in ("UNKNOWN", "PENDING"):
         log.info(f"{job} is not RUNNING")
-        time.sleep(60)
+        time.sleep(delay_s)
+        delay_s = min(2 * delay_s, max_delay_s)
 
 
 def preemption():
@@ -106,18 +112,18 @@ def preemption():
     wait_job_is_running(priority_job)
 
     # if priority_job is running, then job should have been preempted
-    learfair_stderr = job.stderr()
-    assert learfair_stderr is not None, job.paths.stderr
+    interruptions = job.grep_stderr(INTERRUPTED)
+    assert interruptions is not None, job.paths.stderr
 
     log.info(
         f"Job {priority_job} ({priority_job.state}) started, "
-        f"job {job} ({job.state}) should have been preempted: {learfair_stderr}"
+        f"job {job} ({job.state}) should have been preempted: {interruptions} in {job.paths.stderr}"
     )
-    interruptions = [line for line in learfair_stderr.splitlines() if "Interrupted" in line]
-    assert len(interruptions) == 1, interruptions
+    # the stderr tail is only read when the assertion fails
+    assert len(interruptions) == 1, (interruptions, (job.stderr() or "")[-4000:])
     assert job.state in ("PENDING"), job.state
 
-    interrupted_ts = interruptions[0].split("!!! Interrupted on: ")[-1]
+    interrupted_ts = interruptions[0]
     try:
         interrupted_dt = datetime.fromisoformat(interrupted_ts)
     except ValueError:
@@ -133,11 +139,22 @@ def preemption():
     print("Preemption test succeeded ✅")
 
 
+def rmtree(folder: Path, num_workers: int = 32) -> None:
+    """Removes a folder, deleting its files concurrently.
+    Each deletion is slow on the shared filesystems of clusters, so this is much faster
+    than shutil.rmtree on log folders with many small files.
+    """
+    files = [os.path.join(root, name) for root, _, names in os.walk(folder) for name in names]
+    with ThreadPoolExecutor(num_workers) as pool:
+        list(pool.map(os.unlink, files))
+    shutil.rmtree(folder)  # only empty folders remain
+
+
 def main():
     log.info("Hello !")
     if LOGS.exists():
         log.info(f"Cleaning up log folder: {LOGS}")
-        shutil.rmtree(str(LOGS))
+        rmtree(LOGS)
 
     preemption()
 
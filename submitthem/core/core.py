@@ -7,6 +7,9 @@
 import abc
 import asyncio
 import contextlib
+import mmap
+import os
+import re
 import subprocess
 import time as _time
 import typing as tp
@@ -23,10 +26,16 @@ from . import logger, utils
 R = tp.TypeVar("R", covariant=True)
 
 
+_INCOMPLETE_STATES = frozenset(
+    {"READY", "PENDING", "RUNNING", "UNKNOWN", "REQUEUED", "COMPLETING", "PREEMPTED"}
+)
+
+
 class InfoWatcher:
     """An instance of this class is shared by all jobs, and is in charge of calling slurm/pbs to check status for
     all jobs at once (so as not to overload it). It is also in charge of dealing with errors.
     Cluster is called at 0s, 2s, 4s, 8s etc... in the begginning of jobs, then at least every delay_s (default: 60)
+    Registering a job does not call the cluster: the first call only happens when the state of a job is requested.
 
     Parameters
     ----------
@@ -100,8 +109,7 @@ class InfoWatcher:
             one of "force" (forces a call), "standard" (calls regularly) or "cache" (does not call)
         """
         state = self.get_state(job_id, mode=mode)
-        incomplete = ["READY", "PENDING", "RUNNING", "UNKNOWN", "REQUEUED", "COMPLETING", "PREEMPTED"]
-        return state.upper() not in incomplete
+        return state.upper() not in _INCOMPLETE_STATES
 
     def update_if_long_enough(self, mode: str) -> None:
         """Updates if forced to, or if the delay is reached
@@ -111,8 +119,9 @@ class InfoWatcher:
         assert mode in ["standard", "force", "cache"]
         if mode == "cache":
             return
-        last_check_delta = _time.time() - self._last_status_check
-        last_job_delta = _time.time() - self._start_time
+        now = _time.time()
+        last_check_delta = now - self._last_status_check
+        last_job_delta = now - self._start_time
         refresh_delay = min(self._delay_s, max(2, last_job_delta / 2))
         if mode == "force":
             refresh_delay = 0.001
@@ -508,6 +517,35 @@ class Job(tp.Generic[R]):
             return "\n".join(stderr_not_none)
         return self._get_logs_string("stderr")
 
+    def grep_stderr(self, pattern: str) -> list[str] | None:
+        """Returns the matches of a regular expression in the error log file
+        or None if the file does not exist yet.
+        Like re.findall, this returns the first group of each match if the pattern has groups,
+        and the full match otherwise. Contrarily to stderr(), the file is memory-mapped and
+        searched in place instead of being loaded as a string, which is cheaper for large logs.
+
+        Parameter
+        ---------
+        pattern: str
+            the regular expression to look for
+        """
+        if self._sub_jobs:
+            grep_ = [sub_job.grep_stderr(pattern) for sub_job in self._sub_jobs]
+            grep_not_none = [g for g in grep_ if g is not None]
+            if not grep_not_none:
+                return None
+            return [match for g in grep_not_none for match in g]
+        path = self.paths.stderr
+        if not path.exists():
+            return None
+        regex = re.compile(pattern.encode())
+        group = 1 if regex.groups else 0
+        with path.open("rb") as f:
+            if not os.fstat(f.fileno()).st_size:
+                return []  # empty files cannot be memory-mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return [m.group(group).decode(errors="replace") for m in regex.finditer(mapped)]
+
     def awaitable(self) -> "AsyncJobProxy[R]":
         """Returns a proxy object that provides asyncio methods
         for this Job.
@@ -171,9 +171,15 @@ def test_fake_job(tmp_path: Path) -> None:
     # logs
     assert job.stdout() is None
     assert job.stderr() is None
+    assert job.grep_stderr("blu") is None
+    job.paths.stderr.touch()
+    assert job.grep_stderr("blu") == []
     with job.paths.stderr.open("w") as f:
         f.write("blublu")
     assert job.stderr() == "blublu"
+    assert job.grep_stderr("blu") == ["blu", "blu"]
+    assert job.grep_stderr("(b)lu") == ["b", "b"]
+    assert job.grep_stderr("bla") == []
     # result
     utils.cloudpickle_dump(("success", 12), job.paths.result_pickle)
     assert job.result() == 12
@@ -20,12 +20,61 @@ from pathlib import Path
 
 from ..core import core, job_environment, logger, utils
 
+# qsub outputs the job id, optionally with the server domain (e.g. "6122024.<domain>"),
+# either as "job <id>" (some PBS variants) or as a bare job id
+_QSUB_JOB_ID_PATTERN = re.compile(r"job (?P<id>[0-9]+(?:\.\S+)?)|^\s*(?P<bare_id>[0-9]+(?:\.\S+)?)\s*$")
+
+
+# job ids as displayed by qstat: "<main_id>", "<main_id>_<index>" or "<main_id>_[<ranges>]"
+# (ranges being comma-separated like "2,4-12"), with an optional throttle suffix like "%3"
+_JOB_ID_PATTERN = re.compile(
+    r"(?P<main_id>\d+)(?:_(?:(?P<index>\d+)(?:%\d+)?|\[(?P<arrays>[0-9,\-]+)(?:%\d+)?\]))?"
+)
+
+
+# qstat single-letter job states
+_STATE_MAP = {
+    "R": "RUNNING",
+    "Q": "PENDING",
+    "H": "HELD",
+    "S": "SUSPENDED",
+    "E": "EXITING",
+    "C": "COMPLETED",
+    "F": "FAILED",
+    "X": "EXITING",
+    "U": "UNKNOWN",
+}
+_QSTAT_F_JOB_PATTERN = re.compile(r"^Job Id:\s*(\S+)")
+_QSTAT_F_ATTRIBUTE_PATTERN = re.compile(r"^\s*(\S+)\s*=\s*(.*)$")
+_QSTAT_SEPARATOR_PATTERN = re.compile(r"^\s*-+\s*-+")
+_NON_SPACE_PATTERN = re.compile(r"\S*")
+
 
 def read_job_id(job_id: str) -> list[tuple[str, ...]]:
     """Reads formated job id and returns a tuple with format:
     (main_id, [array_index, [final_array_index])
     """
-    # Updated pattern to better handle comma-separated ranges like "2,4-12"
+    return list(_read_job_id(job_id))
+
+
+@functools.lru_cache(maxsize=4096)
+def _read_job_id(job_id: str) -> tuple[tuple[str, ...], ...]:
+    """Cached implementation of read_job_id, since every qstat call lists the same job ids again"""
+    match = _JOB_ID_PATTERN.fullmatch(job_id)
+    if match is None:
+        return tuple(_read_unusual_job_id(job_id))
+    main = match.group("main_id")
+    index = match.group("index")
+    if index is not None:
+        return ((main, str(int(index))),)
+    arrays = match.group("arrays")
+    if arrays is None:
+        return ((main,),)
+    return tuple(tuple([main] + array_range.split("-")) for array_range in arrays.split(","))
+
+
+def _read_unusual_job_id(job_id: str) -> list[tuple[str, ...]]:
+    """Slower fallback of read_job_id for job ids not matching the usual formats"""
     pattern = r"(?P<main_id>\d+)_\[(?P<arrays>[0-9,\-]+)(\%\d+)?\]"
     match = re.search(pattern, job_id)
     if match is not None:
@@ -51,15 +100,45 @@ def read_job_id(job_id: str) -> list[tuple[str, ...]]:
         return [(main_id, array_num)]
 
 
+def _expand_job_ids(split_job_ids: tp.Iterable[tuple[str, ...]]) -> tp.Iterator[str]:
+    """Yields the job ids ("<main_id>" or "<main_id>_<index>") described by the output of read_job_id"""
+    for split_job_id in split_job_ids:
+        main_id = split_job_id[0]
+        if len(split_job_id) == 1:
+            # Non-array job
+            yield main_id
+        elif len(split_job_id) == 2:
+            # Single array task
+            yield f"{main_id}_{split_job_id[1]}"
+        else:
+            # Array range - expand it
+            for idx in range(int(split_job_id[1]), int(split_job_id[2]) + 1):
+                yield f"{main_id}_{idx}"
+
+
 class PBSInfoWatcher(core.InfoWatcher):
-    def _make_command(self) -> list[str] | None:
+    # maximum number of job ids in a single qstat call, so that tracking many jobs
+    # does not exceed the command line length limit
+    _max_ids_per_call = 500
+
+    def _ids_to_check(self) -> list[str]:
         # ask qstat for full info on each main job id
-        to_check = {x.split("_")[0] for x in self._registered - self._finished}
+        return sorted({x.split("_")[0] for x in self._registered - self._finished})
+
+    def _make_command(self, job_ids: list[str] | None = None) -> list[str] | None:
+        to_check = self._ids_to_check() if job_ids is None else job_ids
         if not to_check:
             return None
         # Use qstat -f with specific job IDs and -x flag for finished job support
         # First try to get active jobs, then get finished jobs
-        return ["qstat", "-f", "-x", *sorted(to_check)]
+        return ["qstat", "-f", "-x", *to_check]
+
+    def _make_commands(self) -> list[list[str]]:
+        """Same as _make_command, but split into chunks of at most _max_ids_per_call job ids"""
+        to_check = self._ids_to_check()
+        step = self._max_ids_per_call
+        commands = (self._make_command(to_check[k : k + step]) for k in range(0, len(to_check), step))
+        return [command for command in commands if command is not None]
 
     def get_state(self, job_id: str, mode: str = "standard") -> str:
         """Returns the state of the job (mapped to readable names).
@@ -113,35 +192,18 @@ class PBSInfoWatcher(core.InfoWatcher):
         if not lines:
             return {}
 
-        state_map = {
-            "R": "RUNNING",
-            "Q": "PENDING",
-            "H": "HELD",
-            "S": "SUSPENDED",
-            "E": "EXITING",
-            "C": "COMPLETED",
-            "F": "FAILED",
-            "X": "EXITING",
-            "U": "UNKNOWN",
-            # fallback will return single-letter if unknown
-        }
-
         # Check if this is qstat -f format (starts with "Job Id:" - lowercase 'd')
         # Skip leading empty lines to find the first non-empty line
         for line in lines:
             if line.strip():
-                if re.match(r"^Job Id:\s*\S+", line.strip()):
-                    result = self._read_info_qstat_f_format(lines, state_map)
-                    return result
+                if _QSTAT_F_JOB_PATTERN.match(line.strip()):
+                    return self._read_info_qstat_f_format(lines)
                 break
 
         # Otherwise, parse qstat format (simple column-based format with "Job ID" - uppercase 'D')
-        result = self._read_info_qstat_format(lines, state_map)
-        return result
+        return self._read_info_qstat_format(lines)
 
-    def _read_info_qstat_f_format(
-        self, lines: list[str], state_map: dict[str, str]
-    ) -> dict[str, dict[str, str]]:
+    def _read_info_qstat_f_format(self, lines: list[str]) -> dict[str, dict[str, str]]:
         """Parse qstat -f format output (full format, multi-line blocks)"""
         all_stats: dict[str, dict[str, str]] = {}
 
@@ -150,7 +212,7 @@ class PBSInfoWatcher(core.InfoWatcher):
         current: list[str] = []
         for ln in lines:
             # Start of a job block in qstat -f
-            if re.match(r"^Job Id:\s*\S+", ln):
+            if _QSTAT_F_JOB_PATTERN.match(ln):
                 if current:
                     blocks.append(current)
                 current = [ln]
@@ -166,7 +228,7 @@ class PBSInfoWatcher(core.InfoWatcher):
 
             # Extract job id from the first line: "Job Id: 12345.server" or "Job Id: 12345[1].server"
             first = block[0]
-            m = re.match(r"^Job Id:\s*(\S+)", first)
+            m = _QSTAT_F_JOB_PATTERN.match(first)
             if not m:
                 continue
             raw_jobid = m.group(1)
@@ -185,7 +247,7 @@ class PBSInfoWatcher(core.InfoWatcher):
             # Parse key = value lines
             stats: dict[str, str] = {}
             for ln in block[1:]:
-                kv = re.match(r"^\s*(\S+)\s*=\s*(.*)$", ln)
+                kv = _QSTAT_F_ATTRIBUTE_PATTERN.match(ln)
                 if not kv:
                     continue
                 k = kv.group(1).strip()
@@ -194,7 +256,7 @@ class PBSInfoWatcher(core.InfoWatcher):
 
             # Get job state
             job_state_letter = stats.get("job_state", "")
-            state_val = state_map.get(job_state_letter, job_state_letter) if job_state_letter else "UNKNOWN"
+            state_val = _STATE_MAP.get(job_state_letter, job_state_letter) if job_state_letter else "UNKNOWN"
 
             # Get node list
             node_list_raw = stats.get("exec_host") or stats.get("nodes")
@@ -213,7 +275,7 @@ class PBSInfoWatcher(core.InfoWatcher):
 
             # Parse the job ID to get main job and array indices
             try:
-                multi = read_job_id(normalized_jobid)
+                multi = _read_job_id(normalized_jobid)
             except Exception as e:
                 warnings.warn(
                     f"Could not interpret {raw_jobid} correctly (please open an issue):\n{e}",
@@ -222,40 +284,15 @@ class PBSInfoWatcher(core.InfoWatcher):
                 )
                 continue
 
-            # Expand array ranges
-            for split_job_id in multi:
-                main_id = split_job_id[0]
-                if len(split_job_id) == 1:
-                    # Non-array job
-                    key = main_id
-                    out_stats: dict[str, str] = {"JobID": output_jobid, "State": state_val}
-                    if node_list_str:
-                        out_stats["NodeList"] = node_list_str
-                    all_stats[key] = out_stats
-                elif len(split_job_id) == 2:
-                    # Single array task
-                    array_idx = split_job_id[1]
-                    key = f"{main_id}_{array_idx}"
-                    out_stats = {"JobID": output_jobid, "State": state_val}
-                    if node_list_str:
-                        out_stats["NodeList"] = node_list_str
-                    all_stats[key] = out_stats
-                elif len(split_job_id) >= 3:
-                    # Array range - expand it
-                    start = int(split_job_id[1])
-                    end = int(split_job_id[2])
-                    for idx in range(start, end + 1):
-                        key = f"{main_id}_{idx}"
-                        out_stats = {"JobID": output_jobid, "State": state_val}
-                        if node_list_str:
-                            out_stats["NodeList"] = node_list_str
-                        all_stats[key] = out_stats
+            # Expand array ranges (all the tasks of a row share the same stats dict)
+            out_stats: dict[str, str] = {"JobID": output_jobid, "State": state_val}
+            if node_list_str:
+                out_stats["NodeList"] = node_list_str
+            all_stats.update(dict.fromkeys(_expand_job_ids(multi), out_stats))
 
         return all_stats
 
-    def _read_info_qstat_format(
-        self, lines: list[str], state_map: dict[str, str]
-    ) -> dict[str, dict[str, str]]:
+    def _read_info_qstat_format(self, lines: list[str]) -> dict[str, dict[str, str]]:
         """Parse simple qstat format with fixed-width columns.
 
         Format:
@@ -275,7 +312,7 @@ class PBSInfoWatcher(core.InfoWatcher):
         # Find the separator line (contains dashes) if it exists
         separator_idx = -1
         for i, line in enumerate(lines):
-            if re.match(r"^\s*-+\s*-+", line):
+            if _QSTAT_SEPARATOR_PATTERN.match(line):
                 separator_idx = i
                 break
 
@@ -311,11 +348,9 @@ class PBSInfoWatcher(core.InfoWatcher):
 
             # Extract job ID from fixed position
             if len(line) > jobid_pos:
-                # Find the end of the job ID (next whitespace or fixed width)
-                jobid_end = jobid_pos
-                while jobid_end < len(line) and not line[jobid_end].isspace():
-                    jobid_end += 1
-                raw_jobid = line[jobid_pos:jobid_end].strip()
+                # The job ID ends at the next whitespace
+                jobid_match = _NON_SPACE_PATTERN.match(line, jobid_pos)
+                raw_jobid = jobid_match.group() if jobid_match else ""
                 if not raw_jobid:
                     continue
 
@@ -334,17 +369,16 @@ class PBSInfoWatcher(core.InfoWatcher):
                     state_letter = state_letter[0]
 
             # If we didn't find state, try to extract from the line by looking for single-letter codes
-            if not state_letter or state_letter not in state_map:
+            if state_letter not in _STATE_MAP:
                 # Try alternative: look for known state letters in the latter part of the line
                 for part in line.split():
-                    if len(part) == 1 and part in state_map:
+                    if part in _STATE_MAP:
                         state_letter = part
                         break
+                else:
+                    state_letter = "U"  # Default to UNKNOWN if we can't determine state
 
-            if not state_letter or state_letter not in state_map:
-                state_letter = "U"  # Default to UNKNOWN if we can't determine state
-
-            state_val = state_map.get(state_letter, state_letter)
+            state_val = _STATE_MAP[state_letter]
 
             # Normalize bracketed array form "12345[1-3]" -> "12345_[1-3]"
             # Only add underscore if not already present
@@ -354,7 +388,7 @@ class PBSInfoWatcher(core.InfoWatcher):
 
             # Parse the job ID to get main job and array indices
             try:
-                multi = read_job_id(normalized_jobid)
+                multi = _read_job_id(normalized_jobid)
             except Exception as e:
                 warnings.warn(
                     f"Could not interpret {raw_jobid} correctly (please open an issue):\n{e}",
@@ -368,49 +402,38 @@ class PBSInfoWatcher(core.InfoWatcher):
                 raw_jobid.replace("[", "_[") if "[" in raw_jobid and "_[" not in raw_jobid else raw_jobid
             )
 
-            # Expand array ranges
-            for split_job_id in multi:
-                main_id = split_job_id[0]
-                if len(split_job_id) == 1:
-                    # Non-array job
-                    key = main_id
-                    out_stats = {"JobID": output_jobid, "State": state_val}
-                    all_stats[key] = out_stats
-                elif len(split_job_id) == 2:
-                    # Single array task
-                    array_idx = split_job_id[1]
-                    key = f"{main_id}_{array_idx}"
-                    out_stats = {"JobID": output_jobid, "State": state_val}
-                    all_stats[key] = out_stats
-                elif len(split_job_id) >= 3:
-                    # Array range - expand it
-                    start = int(split_job_id[1])
-                    end = int(split_job_id[2])
-                    for idx in range(start, end + 1):
-                        key = f"{main_id}_{idx}"
-                        out_stats = {"JobID": output_jobid, "State": state_val}
-                        all_stats[key] = out_stats
+            # Expand array ranges (all the tasks of a row share the same stats dict)
+            out_stats = {"JobID": output_jobid, "State": state_val}
+            all_stats.update(dict.fromkeys(_expand_job_ids(multi), out_stats))
 
         return all_stats
 
     def update(self) -> None:
         """Updates the info of all registered jobs with a call to qstat.
         Overrides the base class to use the -x flag for querying finished jobs.
+        All jobs are queried at once, unless there are more than _max_ids_per_call of them,
+        in which case qstat is called once per chunk of job ids.
+        The raw output of the previous update is kept if every call fails.
         """
-        command = self._make_command()
-        if command is None:
+        commands = self._make_commands()
+        if not commands:
             return
-        self._num_calls += 1
-        try:
-            logger.get_logger().debug(f"Call #{self.num_calls} - Command {' '.join(command)}")
-            # Use -x flag to include finished jobs in query results
-            self._output = subprocess.check_output(command, shell=False)
-        except Exception as e:
-            logger.get_logger().warning(
-                f"Call #{self.num_calls} - Bypassing qstat error {e}, status may be inaccurate."
-            )
-        else:
-            self._info_dict.update(self.read_info(self._output))
+        outputs = []
+        for command in commands:
+            self._num_calls += 1
+            try:
+                logger.get_logger().debug(f"Call #{self.num_calls} - Command {' '.join(command)}")
+                # Use -x flag to include finished jobs in query results
+                output = subprocess.check_output(command, shell=False)
+            except Exception as e:
+                logger.get_logger().warning(
+                    f"Call #{self.num_calls} - Bypassing qstat error {e}, status may be inaccurate."
+                )
+            else:
+                outputs.append(output)
+                self._info_dict.update(self.read_info(output))
+        if outputs:
+            self._output = b"".join(outputs)
         self._last_status_check = _time.time()
         # check for finished jobs
         to_check = self._registered - self._finished
@@ -425,7 +448,7 @@ class PBSJob(core.Job[core.R]):
         delay_s=60
     )  # Check status frequently during job allocation/execution (max 60s between checks)
 
-    @property
+    @functools.cached_property
     def paths(self) -> utils.JobPaths:
         """Override paths to handle PBS domain suffixes in job IDs.
 
@@ -433,6 +456,8 @@ class PBSJob(core.Job[core.R]):
         but the actual files created by the job script use the main job ID
         from $PBS_JOBID environment variable. This property strips the domain
         suffix to ensure we look for files with the correct name.
+        The job id does not change, so this is computed once per job instead of
+        at each of the (many) accesses while polling for results.
         """
         # Strip domain suffix from job_id for PBS jobs (format: "main_id.<domain>" or "main_id_task.<domain>")
         job_id_parts = self.job_id.split(".")
@@ -890,19 +915,14 @@ class PBSExecutor(core.PicklingExecutor):
         """Returns the job ID from the output of qsub string"""
         if not isinstance(string, str):
             string = string.decode()
-        # PBS qsub outputs job ID directly, optionally with domain (e.g., "6122024.<domain>")
-        # Try to match "job <id>" format first (some PBS variants), then fall back to bare job ID
-        output = re.search(r"job (?P<id>[0-9]+(?:\.[^\s]+)?)", string)
-        if output is None:
-            # Try bare job ID format: digits optionally followed by dot and domain
-            output = re.search(r"^(?P<id>[0-9]+(?:\.[^\s]+)?)\s*$", string.strip())
+        output = _QSUB_JOB_ID_PATTERN.search(string)
         if output is None:
             raise utils.FailedSubmissionError(
                 f'Could not make sense of qsub output "{string}"\n'
                 "Job instance will not be able to fetch status\n"
                 "(you may however set the job job_id manually if needed)"
             )
-        return output.group("id")
+        return output.group("id") or output.group("bare_id")
 
     @classmethod
     def affinity(cls) -> int:
@@ -917,6 +937,46 @@ def _get_default_parameters() -> dict[str, tp.Any]:
     return {key: val for key, val in zipped if key not in {"command", "folder", "map_count"}}
 
 
+# _make_qsub_string arguments which are not converted into #PBS directives
+_NON_PBS_PARAMETERS = frozenset(
+    {
+        "folder",
+        "command",
+        "map_count",
+        "array_parallelism",
+        "additional_parameters",
+        "setup",
+        "signal_delay_s",
+        "stderr_to_stdout",
+    }
+)
+# static parts of the qsub file, shared by all submissions
+_QSUB_HEADER = ("#!/bin/bash", "", "# Parameters")
+_QSUB_COMMAND_PREAMBLE = (
+    "",
+    "# command",
+    "export SUBMITTHEM_EXECUTOR=pbs",
+    "# Allow time for qalter to set output file paths before job starts writing logs",
+    "sleep 0.5",
+    '# The input "command" is supposed to be a valid shell command',
+    "set -e  # Exit on error",
+)
+# job id tags of log paths, for single jobs and for job arrays
+_JOB_ID_TAG = "%j"
+_ARRAY_JOB_ID_TAG = "%A_%a"
+# special key mappings for PBS compatibility
+_PBS_FLAG_MAP = {
+    "job-name": "N",
+    "output": "o",
+    "error": "e",
+    "join": "j",
+    "J": "J",  # Array job range
+    "select": "l select",
+    "place": "l place",
+    "walltime": "l walltime",
+}
+
+
 # pylint: disable=too-many-arguments,unused-argument, too-many-locals
 def _make_qsub_string(
     command: str,
@@ -982,18 +1042,7 @@ def _make_qsub_string(
         In case an erroneous keyword argument is added, a list of all eligible parameters
         is printed, with their default values
     """
-    nonpbs = [
-        "nonpbs",
-        "folder",
-        "command",
-        "map_count",
-        "array_parallelism",
-        "additional_parameters",
-        "setup",
-        "signal_delay_s",
-        "stderr_to_stdout",
-    ]
-    parameters = {k: v for k, v in locals().items() if v is not None and k not in nonpbs}
+    parameters = {k: v for k, v in locals().items() if v is not None and k not in _NON_PBS_PARAMETERS}
     ### rename and reformat parameters
 
     # Merge additional_parameters early so they go through conversion logic
@@ -1105,47 +1154,31 @@ def _make_qsub_string(
         )
 
     # add necessary parameters
-    paths = utils.JobPaths(folder=folder)
-    stdout = str(paths.stdout)
-    stderr = str(paths.stderr)
     # Job arrays will write files in the form  <ARRAY_ID>_<ARRAY_TASK_ID>_<TASK_ID>
     if map_count is not None:
         assert isinstance(map_count, int) and map_count
         parameters["J"] = f"0-{map_count - 1}%{min(map_count, array_parallelism)}"
-        stdout = stdout.replace("%j", "%A_%a")
-        stderr = stderr.replace("%j", "%A_%a")
+    job_id_tag = _ARRAY_JOB_ID_TAG if map_count is not None else _JOB_ID_TAG
     # Use PBS output redirection with proper path handling
     # PBS will substitute %j with the job ID when the job runs
-    parameters["o"] = stdout.replace("%t", "0")
+    paths = utils.JobPaths(folder=folder)
+    parameters["o"] = str(paths.stdout).replace(_JOB_ID_TAG, job_id_tag).replace("%t", "0")
     if not stderr_to_stdout:
-        parameters["e"] = stderr.replace("%t", "0")
+        parameters["e"] = str(paths.stderr).replace(_JOB_ID_TAG, job_id_tag).replace("%t", "0")
         parameters["j"] = "oe"
 
     #
     # remove --open-mode option as there is no equivalent for PBS
     # parameters["open-mode"] = "append"
     # now create
-    lines = ["#!/bin/bash", "", "# Parameters"]
-    for k in sorted(parameters):
-        lines.append(_as_qsub_flag(k, parameters[k]))
+    lines = [*_QSUB_HEADER, *(_as_qsub_flag(k, parameters[k]) for k in sorted(parameters))]
     # environment setup:
     if setup is not None:
         lines += ["", "# setup"] + setup
     # commandline (this will run the function and args specified in the file provided as argument)
     # We pass -o and -e here, (TODO: check this statement for PBS: because the qsub
     # command doesn't work as expected with a filename pattern)
-
-    lines += [
-        "",
-        "# command",
-        "export SUBMITTHEM_EXECUTOR=pbs",
-        "# Allow time for qalter to set output file paths before job starts writing logs",
-        "sleep 0.5",
-        '# The input "command" is supposed to be a valid shell command',
-        "set -e  # Exit on error",
-        command,
-        "",
-    ]
+    lines += [*_QSUB_COMMAND_PREAMBLE, command, ""]
     return "\n".join(lines)
 
 
@@ -1161,20 +1194,8 @@ def _as_qsub_flag(key: str, value: tp.Any) -> str:
     PBS uses format: #PBS -flag value or #PBS -flag=value
     Different flags have different conventions.
     """
-    # Handle special key mappings for PBS compatibility
-    pbs_flag_map = {
-        "job-name": "N",
-        "output": "o",
-        "error": "e",
-        "join": "j",
-        "J": "J",  # Array job range
-        "select": "l select",
-        "place": "l place",
-        "walltime": "l walltime",
-    }
-
     # Map the key if it's in our special map, otherwise replace underscores with hyphens
-    key = pbs_flag_map.get(key, key.replace("_", "-"))
+    key = _PBS_FLAG_MAP.get(key, key.replace("_", "-"))
 
     # Handle boolean flags
     if value is True:
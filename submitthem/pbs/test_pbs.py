@@ -62,12 +62,16 @@ class MockedPBSSubprocess(test_core.MockedSubprocess):
         """
         if not submission_file.exists():
             return 0
-        array_lines = [line for line in submission_file.read_text().splitlines() if "-J" in line]
-        if array_lines:
-            # line should look like: #PBS -J 0-12%3 or #PBS -J 0-12:3
-            # Extract the end index (12 in "0-12")
-            array_str = array_lines[0].split(" 0-")[-1].split("%")[0].split(":")[0]
-            return int(array_str) + 1
+        with submission_file.open() as f:
+            # directives are in the leading comment block, no need to read further
+            for line in f:
+                if line.strip() and not line.startswith("#"):
+                    break
+                if line.startswith("#PBS -J"):
+                    # line should look like: #PBS -J 0-12%3 or #PBS -J 0-12:3
+                    # Extract the end index (12 in "0-12")
+                    array_str = line.split(" 0-")[-1].split("%")[0].split(":")[0]
+                    return int(array_str) + 1
         return 0
 
     def get_job_context_env_vars(self, job_id: str) -> dict[str, str]:
@@ -99,6 +103,15 @@ def test_mocked_missing_state(tmp_path: Path) -> None:
         job._interrupt(timeout=False)  # check_call is bypassed by MockedSubprocess
 
 
+def test_pbs_job_paths_strip_domain(tmp_path: Path) -> None:
+    with mocked_pbs():
+        job: pbs.PBSJob[None] = pbs.PBSJob(tmp_path, "6122024.pbs01")
+        assert job.paths.job_id == "6122024"
+        assert job.paths.stdout == tmp_path / "6122024_0_log.out"
+        paths = job.paths
+        assert job.paths is paths
+
+
 def test_job_environment() -> None:
     with mocked_pbs() as mock:
         mock.set_job_state("12", "RUNNING")
@@ -136,6 +149,7 @@ def test_pbs_job_array_mocked(use_batch_api: bool, tmp_path: Path) -> None:
         executor = pbs.PBSExecutor(folder=tmp_path)
         executor.update_parameters(array_parallelism=3)
         data1, data2 = range(n), range(10, 10 + n)
+        start = mock.job_count
 
         def add(x: int, y: int) -> int:
             assert x in data1
@@ -149,6 +163,8 @@ def test_pbs_job_array_mocked(use_batch_api: bool, tmp_path: Path) -> None:
                     jobs.append(executor.submit(add, d1, d2))
         else:
             jobs = executor.map_array(add, data1, data2)
+        # the whole array is submitted through a single qsub call
+        assert mock.job_count == start + 1
         array_id = jobs[0].job_id.split("_")[0]
         assert [f"{array_id}_{a}" for a in range(n)] == [j.job_id for j in jobs]
 
@@ -331,6 +347,15 @@ def test_make_qsub_stderr() -> None:
     assert "#PBS -e" not in string
 
 
+def test_make_qsub_string_array_logs() -> None:
+    string = pbs._make_qsub_string(command="blublu", folder="/tmp", map_count=3)
+    assert "#PBS -J 0-2%3" in string
+    assert "#PBS -o /tmp/%A_%a_0_log.out" in string
+    assert "#PBS -e /tmp/%A_%a_0_log.err" in string
+    string = pbs._make_qsub_string(command="blublu", folder="/tmp")
+    assert "#PBS -o /tmp/%j_0_log.out" in string
+
+
 def test_update_parameters(tmp_path: Path) -> None:
     with mocked_pbs():
         executor = submitthem.AutoExecutor(folder=tmp_path)
@@ -486,6 +511,8 @@ Job Id: 20956421[2-4%25]
     assert output["20956421_3"] == {"JobID": "20956421_[2-4%25]", "State": "PENDING"}
     assert output["20956421_4"] == {"JobID": "20956421_[2-4%25]", "State": "PENDING"}
     assert set(output) == {"5610980", "20956421_0", "20956421_2", "20956421_3", "20956421_4"}
+    # tasks of a same range share their stats
+    assert output["20956421_2"] is output["20956421_4"]
 
 
 def test_read_info_qstat_format() -> None:
@@ -527,16 +554,28 @@ def test_read_info_array(name: str, state: str) -> None:
         ("20_[2-7%56]", [(20, 2, 7)]),
         ("20_[2-7,12-17,22%56]", [(20, 2, 7), (20, 12, 17), (20, 22)]),
         ("20_[0%1]", [(20, 0)]),
+        ("20_4%3", [(20, 4)]),
+        ("20_007", [(20, 7)]),
+        ("x20_[2-3]", [(20, 2, 3)]),
     ],
 )
 def test_read_job_id(job_id: str, expected: list[tuple[int | str, ...]]) -> None:
     output = pbs.read_job_id(job_id)
     assert output == [tuple(str(x) for x in group) for group in expected]
+    # results are cached, but modifying the output must not alter the cache
+    output.clear()
+    assert pbs.read_job_id(job_id) == [tuple(str(x) for x in group) for group in expected]
 
 
 @pytest.mark.parametrize(  # type: ignore
     "string,expected",
-    [(b"Submitted batch job 5610208\n", "5610208"), ("Submitted batch job 5610208\n", "5610208")],
+    [
+        (b"Submitted batch job 5610208\n", "5610208"),
+        ("Submitted batch job 5610208\n", "5610208"),
+        ("Submitted batch job 5610208.pbs01\n", "5610208.pbs01"),
+        (b"6122024.pbs01.cluster\n", "6122024.pbs01.cluster"),
+        ("  6122024\n", "6122024"),
+    ],
 )
 def test_get_id_from_submission_command(string: str, expected: str) -> None:
     output = pbs.PBSExecutor._get_job_id_from_submission_command(string)
@@ -566,6 +605,45 @@ def test_watcher() -> None:
         assert watcher._finished == {"12"}
 
 
+def test_watcher_splits_qstat_calls() -> None:
+    with mocked_pbs() as mock:
+        watcher = pbs.PBSInfoWatcher()
+        watcher._max_ids_per_call = 2
+        for job_id in ["12", "13", "14", "15", "16"]:
+            mock.set_job_state(job_id, "RUNNING")
+            watcher.register_job(job_id)
+        assert [cmd[3:] for cmd in watcher._make_commands()] == [["12", "13"], ["14", "15"], ["16"]]
+        assert watcher.get_state("16", mode="force") == "RUNNING"
+        assert watcher.num_calls == 3
+        assert all(watcher._info_dict[job_id]["State"] == "RUNNING" for job_id in ["12", "14", "16"])
+
+
+def test_watcher_keeps_output_when_qstat_fails() -> None:
+    with mocked_pbs() as mock:
+        watcher = pbs.PBSInfoWatcher()
+        mock.set_job_state("12", "RUNNING")
+        watcher.register_job("12")
+        watcher.update()
+        output = watcher._output
+        assert b"12" in output
+        with patch("subprocess.check_output", side_effect=subprocess.CalledProcessError(1, "qstat")):
+            watcher.update()
+        assert watcher._output == output
+        assert watcher.get_state("12", mode="cache") == "RUNNING"
+
+
+def test_watcher_not_called_before_state_is_requested(tmp_path: Path) -> None:
+    with mocked_pbs():
+        watcher = pbs.PBSJob.watcher
+        num_calls = watcher.num_calls
+        executor = pbs.PBSExecutor(folder=tmp_path)
+        jobs = executor.map_array(test_core.do_nothing, range(4))
+        assert watcher.num_calls == num_calls
+        assert [job.state for job in jobs] == ["RUNNING"] * 4
+        # a single qstat call serves all the jobs of the array
+        assert watcher.num_calls == num_calls + 1
+
+
 def test_get_default_parameters() -> None:
     defaults = pbs._get_default_parameters()
     assert defaults["nodes"] == 1